@@ -1,6 +1,22 @@
 import os
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, Optional
+
+
+class PoolSettings:
+    def __init__(
+        self,
+        name: str,
+        min_size: int,
+        max_size: int,
+        timeout_seconds: float,
+    ) -> None:
+        prefix = f"DB_POOL_{name.upper()}_"
+        self.name = name
+        self.min_size = int(os.getenv(f"{prefix}MIN_SIZE", min_size))
+        self.max_size = int(os.getenv(f"{prefix}MAX_SIZE", max_size))
+        self.timeout_seconds = float(os.getenv(f"{prefix}TIMEOUT_SECONDS", timeout_seconds))
+
 
 class Settings:
     def __init__(
@@ -15,6 +31,17 @@ class Settings:
         )
         self.db_pool_min_size = int(os.getenv("DB_POOL_MIN_SIZE", db_pool_min_size))
         self.db_pool_max_size = int(os.getenv("DB_POOL_MAX_SIZE", db_pool_max_size))
+        # Named pools isolate short interactive requests from long-running
+        # exports and LISTEN/SSE connections so one class cannot starve another.
+        # bulk and listen are reserved for those consumers and have none yet.
+        # DB_POOL_MIN_SIZE/DB_POOL_MAX_SIZE remain the interactive defaults.
+        self.db_pools: Dict[str, PoolSettings] = {
+            "interactive": PoolSettings(
+                "interactive", self.db_pool_min_size, self.db_pool_max_size, 2.0
+            ),
+            "bulk": PoolSettings("bulk", 0, 4, 10.0),
+            "listen": PoolSettings("listen", 0, 2, 5.0),
+        }
 
 
 @lru_cache(maxsize=1)
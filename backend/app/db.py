@@ -1,36 +1,89 @@
-from typing import AsyncGenerator, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Dict
 
+from psycopg import AsyncConnection
 from psycopg.rows import dict_row
-from psycopg_pool import AsyncConnectionPool
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
 
 from .config import get_settings
 
-pool: Optional[AsyncConnectionPool] = None
+pools: Dict[str, AsyncConnectionPool] = {}
 
 
-async def init_pool() -> AsyncConnectionPool:
-    global pool
+class PoolUnavailable(Exception):
+    """Raised when a connection cannot be checked out before the pool timeout."""
+
+    def __init__(self, pool_name: str, timeout: float) -> None:
+        super().__init__(f"{pool_name} database pool exhausted after {timeout:g}s")
+        self.pool_name = pool_name
+        self.timeout = timeout
+
+
+async def init_pool(name: str = "interactive") -> AsyncConnectionPool:
     settings = get_settings()
+    pool_settings = settings.db_pools[name]
+    pool = pools.get(name)
     if pool is None:
         pool = AsyncConnectionPool(
             conninfo=settings.database_url,
-            min_size=settings.db_pool_min_size,
-            max_size=settings.db_pool_max_size,
+            min_size=pool_settings.min_size,
+            max_size=pool_settings.max_size,
+            timeout=pool_settings.timeout_seconds,
+            name=name,
             open=False,
         )
+        pools[name] = pool
     if pool.closed:
         await pool.open()
     return pool
 
 
-async def close_pool() -> None:
-    if pool is not None and not pool.closed:
-        await pool.close()
+async def init_pools() -> None:
+    # Only the interactive pool has consumers today; bulk and listen are
+    # reserved for exports and LISTEN/SSE and open lazily on first checkout.
+    await init_pool("interactive")
 
 
-async def get_db() -> AsyncGenerator:
-    current_pool = await init_pool()
-    async with current_pool.connection() as conn:
+async def close_pools() -> None:
+    for pool in pools.values():
+        if not pool.closed:
+            await pool.close()
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    stats: Dict[str, Dict[str, Any]] = {}
+    for name, pool_settings in get_settings().db_pools.items():
+        pool = pools.get(name)
+        stats[name] = {
+            "pool_min": pool_settings.min_size,
+            "pool_max": pool_settings.max_size,
+            "timeout_seconds": pool_settings.timeout_seconds,
+            "open": pool is not None and not pool.closed,
+            **(pool.get_stats() if pool is not None else {}),
+        }
+    return stats
+
+
+@asynccontextmanager
+async def connection(name: str = "interactive") -> AsyncIterator[AsyncConnection]:
+    """Check a connection out of the named pool, failing fast when it is exhausted.
+
+    Short read-only routes use this directly so the connection goes back to the
+    pool before the response body is serialized.
+    """
+    current_pool = await init_pool(name)
+    try:
+        conn = await current_pool.getconn()
+    except PoolTimeout as exc:
+        raise PoolUnavailable(name, current_pool.timeout) from exc
+    try:
         conn.row_factory = dict_row
-        conn.autocommit = True
+        await conn.set_autocommit(True)
+        yield conn
+    finally:
+        await current_pool.putconn(conn)
+
+
+async def get_db() -> AsyncGenerator:
+    async with connection() as conn:
         yield conn
@@ -1,18 +1,28 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 
 from .api.v1.routes import router as api_router
-from .db import close_pool, init_pool
+from .db import PoolUnavailable, close_pools, init_pools
+from .responses import RowJSONResponse
 
 app = FastAPI(title="EIO Backend API")
 
 app.include_router(api_router, prefix="/api/v1")
 
 
+@app.exception_handler(PoolUnavailable)
+async def pool_unavailable_handler(request: Request, exc: PoolUnavailable) -> RowJSONResponse:
+    return RowJSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.on_event("startup")
 async def on_startup() -> None:
-    await init_pool()
+    await init_pools()
 
 
 @app.on_event("shutdown")
 async def on_shutdown() -> None:
-    await close_pool()
+    await close_pools()
@@ -119,5 +119,26 @@ class JobRepository:
         )
         return await cursor.fetchone()
 
+    async def list_worker_heartbeats(
+        self, conn: AsyncConnection, *, stale_after_seconds: int = 60
+    ) -> List[Dict[str, Any]]:
+        cursor = await conn.execute(
+            """
+            SELECT
+                worker_id,
+                site_id,
+                last_seen,
+                payload,
+                last_seen < now() - make_interval(secs => %s) AS stale
+            FROM worker_heartbeats
+            ORDER BY
+                last_seen < now() - make_interval(secs => %s),
+                COALESCE((payload->'concurrency'->>'in_use')::int, 0),
+                last_seen DESC
+            """,
+            (stale_after_seconds, stale_after_seconds),
+        )
+        return await cursor.fetchall()
+
 
 jobs = JobRepository()
@@ -0,0 +1,50 @@
+from datetime import timedelta
+from decimal import Decimal
+from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Address, IPv6Interface, IPv6Network
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+_STR_TYPES = (
+    IPv4Address,
+    IPv4Interface,
+    IPv4Network,
+    IPv6Address,
+    IPv6Interface,
+    IPv6Network,
+)
+
+
+def _default(value: Any) -> Any:
+    # orjson already handles UUID, datetime/date/time, dict/list and str/int/float
+    # natively; only the remaining psycopg types need a Python fallback. The
+    # conversions mirror fastapi.encoders.jsonable_encoder so the wire format is
+    # unchanged.
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, _STR_TYPES):
+        return str(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).decode()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_rows(content: Any) -> bytes:
+    """Serialize ``dict_row`` results (and envelopes around them) to JSON bytes in one pass."""
+    return orjson.dumps(content, default=_default)
+
+
+class RowJSONResponse(JSONResponse):
+    """JSON response that encodes psycopg rows directly, skipping ``jsonable_encoder``.
+
+    Routes should return an instance of this class rather than a plain dict so
+    FastAPI does not run its own response serialization first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return encode_rows(content)
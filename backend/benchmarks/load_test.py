@@ -0,0 +1,416 @@
+"""Load-test the backend API against a local Postgres.
+
+Two subcommands:
+
+``seed``
+    Bulk-load synthetic sites, vCenters, VMs, jobs and job events with
+    set-based ``generate_series`` inserts. Apply ``db/migrations`` first.
+
+``run``
+    Replay a weighted mix of ``/inventory/vms``, ``/jobs``, ``/jobs/{id}``,
+    ``/health`` and sync-creation calls at a fixed concurrency and write
+    throughput, latency percentiles and DB time per route to a JSON file.
+
+By default ``run`` drives ``app.main:app`` in-process through httpx's ASGI
+transport, which lets it attribute time spent in psycopg cursors to each
+route. Pass ``--base-url`` to target a running server instead; DB time is then
+not available.
+
+Usage (from ``backend/``)::
+
+    pip install -r requirements.txt -r benchmarks/requirements.txt
+    python -m benchmarks.load_test seed --vms 100000 --jobs 1000000 --events 10000000
+    python -m benchmarks.load_test run --concurrency 32 --duration 60
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+import psycopg
+from psycopg import AsyncCursor
+from psycopg.rows import dict_row
+
+from app.config import get_settings
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# Accumulates seconds spent in cursor.execute for the request being timed.
+_db_time: ContextVar[Optional[List[float]]] = ContextVar("_db_time", default=None)
+
+
+async def _execute(conn: psycopg.AsyncConnection, label: str, sql: str, params: Any = None) -> None:
+    started = time.perf_counter()
+    await conn.execute(sql, params)
+    await conn.commit()
+    print(f"  {label}: {time.perf_counter() - started:.1f}s")
+
+
+async def seed(args: argparse.Namespace) -> None:
+    conn = await psycopg.AsyncConnection.connect(get_settings().database_url)
+    async with conn:
+        if args.reset:
+            await _execute(
+                conn,
+                "truncate",
+                """
+                TRUNCATE job_events, job_steps, jobs, vcenter_vms_current,
+                         vcenter_hosts_current, vcenter_clusters_current,
+                         vcenters, sites, worker_heartbeats
+                """,
+            )
+        else:
+            # Sites, vCenters and VMs are upserts, but jobs and events are not:
+            # seeding twice would double them and skew every jobs route.
+            cursor = await conn.execute("SELECT EXISTS (SELECT 1 FROM jobs WHERE description = 'Load test seed')")
+            row = await cursor.fetchone()
+            if row and row[0]:
+                raise SystemExit("database already contains load-test seed data; rerun with --reset")
+
+        await _execute(
+            conn,
+            f"{args.sites} sites",
+            """
+            INSERT INTO sites (code, name, timezone)
+            SELECT 'load-' || g, 'Load Site ' || g, 'UTC'
+            FROM generate_series(1, %s::int) AS g
+            ON CONFLICT (code) DO NOTHING
+            """,
+            (args.sites,),
+        )
+        await _execute(
+            conn,
+            f"{args.vcenters} vCenters",
+            """
+            WITH site_ids AS (
+                SELECT array_agg(id ORDER BY code) AS ids FROM sites WHERE code LIKE 'load-%%'
+            )
+            INSERT INTO vcenters (site_id, name, fqdn, version, status)
+            SELECT
+                ids[1 + g %% cardinality(ids)],
+                'vc-' || g,
+                'vc-' || g || '.load.local',
+                '8.0.2',
+                'connected'
+            FROM generate_series(1, %s::int) AS g, site_ids
+            ON CONFLICT (fqdn) DO NOTHING
+            """,
+            (args.vcenters,),
+        )
+        await _execute(
+            conn,
+            f"{args.vms} VMs",
+            """
+            WITH vcenter_ids AS (
+                SELECT array_agg(id ORDER BY fqdn) AS ids FROM vcenters WHERE fqdn LIKE '%%.load.local'
+            )
+            INSERT INTO vcenter_vms_current (
+                vcenter_id, host_moid, moid, uuid, payload_json, payload_hash, observed_at
+            )
+            SELECT
+                ids[1 + g %% cardinality(ids)],
+                'host-' || (g %% 64 + 1),
+                'vm-' || g,
+                gen_random_uuid()::text,
+                jsonb_build_object(
+                    'name', 'vm-' || lpad(g::text, 7, '0') || '.load.local',
+                    'moid', 'vm-' || g,
+                    'host_moid', 'host-' || (g %% 64 + 1),
+                    'power_state', (ARRAY['poweredOn', 'poweredOff', 'suspended'])[1 + g %% 3],
+                    'vcpu', 1 + g %% 16,
+                    'memory_mb', (ARRAY[2048, 4096, 8192, 16384])[1 + g %% 4]
+                ),
+                md5(g::text),
+                now() - make_interval(secs => g %% 86400)
+            FROM generate_series(1, %s::int) AS g, vcenter_ids
+            ON CONFLICT (vcenter_id, moid) DO NOTHING
+            """,
+            (args.vms,),
+        )
+        await _execute(
+            conn,
+            f"{args.jobs} jobs",
+            """
+            WITH vcenter_ids AS (
+                SELECT array_agg(id ORDER BY fqdn) AS ids,
+                       array_agg(site_id ORDER BY fqdn) AS site_ids
+                FROM vcenters WHERE fqdn LIKE '%%.load.local'
+            )
+            INSERT INTO jobs (
+                type, name, description, status, site_id, target_type, target_ids,
+                started_at, completed_at, progress, created_at, updated_at
+            )
+            SELECT
+                'vcenter_inventory_sync',
+                'Inventory sync #' || g,
+                'Load test seed',
+                CASE WHEN g %% 1000 = 0 THEN 'pending'
+                     WHEN g %% 50 = 0 THEN 'failed'
+                     ELSE 'completed' END,
+                site_ids[1 + g %% cardinality(ids)],
+                'vcenter',
+                ARRAY[ids[1 + g %% cardinality(ids)]::text],
+                ts,
+                CASE WHEN g %% 1000 = 0 THEN NULL ELSE ts + interval '3 minutes' END,
+                CASE WHEN g %% 1000 = 0 THEN 0 ELSE 100 END,
+                ts,
+                ts
+            FROM generate_series(1, %s::int) AS g, vcenter_ids,
+                 LATERAL (SELECT now() - make_interval(secs => g * 7) AS ts) AS t
+            """,
+            (args.jobs,),
+        )
+        await _execute(
+            conn,
+            f"~{args.events} job events",
+            """
+            INSERT INTO job_events (job_id, timestamp, level, message, data, created_at)
+            SELECT
+                j.id,
+                j.created_at + make_interval(secs => n),
+                CASE WHEN n = 0 AND j.status = 'failed' THEN 'error' ELSE 'info' END,
+                'Seeded event ' || n,
+                jsonb_build_object('sequence', n),
+                j.created_at + make_interval(secs => n)
+            FROM jobs j, generate_series(0, %s::int - 1) AS n
+            WHERE j.description = 'Load test seed'
+            """,
+            (max(1, args.events // max(1, args.jobs)),),
+        )
+        await _execute(conn, "analyze", "ANALYZE")
+
+
+class RouteMix:
+    """Weighted request generator over ids sampled from the seeded database."""
+
+    def __init__(self, vcenter_ids: List[str], job_ids: List[str], vm_pages: int) -> None:
+        self.vcenter_ids = vcenter_ids
+        self.job_ids = job_ids
+        self.vm_pages = max(1, vm_pages)
+        self.routes: List[Tuple[str, int, Callable[[], Tuple[str, str]]]] = [
+            ("GET /inventory/vms", 40, self.list_vms),
+            ("GET /jobs", 25, lambda: ("GET", "/api/v1/jobs?limit=100")),
+            ("GET /jobs/{id}", 20, lambda: ("GET", f"/api/v1/jobs/{random.choice(self.job_ids)}")),
+            ("GET /health", 10, lambda: ("GET", "/api/v1/health")),
+            (
+                "POST /vcenters/{id}/sync",
+                5,
+                lambda: ("POST", f"/api/v1/vcenters/{random.choice(self.vcenter_ids)}/sync"),
+            ),
+        ]
+        self.weights = [weight for _, weight, _ in self.routes]
+
+    def list_vms(self) -> Tuple[str, str]:
+        offset = random.randrange(self.vm_pages) * 100
+        if random.random() < 0.5:
+            return "GET", f"/api/v1/inventory/vms?limit=100&offset={offset}"
+        vcenter_id = random.choice(self.vcenter_ids)
+        return "GET", f"/api/v1/inventory/vms?vcenter_id={vcenter_id}&limit=100"
+
+    def next(self) -> Tuple[str, str, str]:
+        name, _, build = random.choices(self.routes, weights=self.weights)[0]
+        method, url = build()
+        return name, method, url
+
+
+async def load_route_mix(max_vm_pages: int) -> Tuple[RouteMix, Dict[str, int]]:
+    async with await psycopg.AsyncConnection.connect(
+        get_settings().database_url, row_factory=dict_row
+    ) as conn:
+        cursor = await conn.execute("SELECT id FROM vcenters ORDER BY random() LIMIT 1000")
+        vcenter_ids = [str(row["id"]) for row in await cursor.fetchall()]
+        cursor = await conn.execute("SELECT id FROM jobs TABLESAMPLE SYSTEM (1) LIMIT 5000")
+        job_ids = [str(row["id"]) for row in await cursor.fetchall()]
+        if not job_ids:
+            cursor = await conn.execute("SELECT id FROM jobs LIMIT 5000")
+            job_ids = [str(row["id"]) for row in await cursor.fetchall()]
+        cursor = await conn.execute("SELECT COUNT(*) AS total FROM vcenter_vms_current")
+        vm_total = (await cursor.fetchone())["total"]
+        table_sizes = await _table_sizes(conn)
+    if not vcenter_ids or not job_ids:
+        raise SystemExit("database has no vCenters or jobs; run the seed subcommand first")
+    return RouteMix(vcenter_ids, job_ids, min(max_vm_pages, vm_total // 100)), table_sizes
+
+
+async def _table_sizes(conn: psycopg.AsyncConnection) -> Dict[str, int]:
+    cursor = await conn.execute(
+        """
+        SELECT relname, reltuples::bigint AS estimate
+        FROM pg_class
+        WHERE relname IN ('sites', 'vcenters', 'vcenter_vms_current', 'jobs', 'job_steps', 'job_events')
+        """
+    )
+    return {row["relname"]: row["estimate"] for row in await cursor.fetchall()}
+
+
+def _install_db_timer() -> None:
+    original = AsyncCursor.execute
+
+    async def timed_execute(self, *args: Any, **kwargs: Any) -> Any:
+        bucket = _db_time.get()
+        if bucket is None:
+            return await original(self, *args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return await original(self, *args, **kwargs)
+        finally:
+            bucket.append(time.perf_counter() - started)
+
+    AsyncCursor.execute = timed_execute
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def summarize(samples: Dict[str, List[Tuple[float, Optional[float], int]]], elapsed: float) -> Dict[str, Any]:
+    routes: Dict[str, Any] = {}
+    for name, entries in sorted(samples.items()):
+        latencies = sorted(latency for latency, _, _ in entries)
+        db_times = [db for _, db, _ in entries if db is not None]
+        errors = sum(1 for _, _, status in entries if status >= 400)
+        routes[name] = {
+            "requests": len(entries),
+            "errors": errors,
+            "req_per_s": round(len(entries) / elapsed, 2),
+            "latency_ms": {
+                "p50": round(_percentile(latencies, 0.50) * 1000, 2),
+                "p90": round(_percentile(latencies, 0.90) * 1000, 2),
+                "p99": round(_percentile(latencies, 0.99) * 1000, 2),
+                "max": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+            },
+            "db_ms_mean": round(sum(db_times) / len(db_times) * 1000, 2) if db_times else None,
+        }
+    total = sum(route["requests"] for route in routes.values())
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "requests": total,
+        "req_per_s": round(total / elapsed, 2),
+        "routes": routes,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    mix, table_sizes = await load_route_mix(args.max_vm_pages)
+    in_process = args.base_url is None
+    if in_process:
+        from app.db import close_pools, init_pools
+        from app.main import app
+
+        _install_db_timer()
+        await init_pools()
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://load-test", timeout=30
+        )
+    else:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=30)
+
+    samples: Dict[str, List[Tuple[float, Optional[float], int]]] = {}
+    deadline = 0.0
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            name, method, url = mix.next()
+            bucket: List[float] = []
+            token = _db_time.set(bucket if in_process else None)
+            started = time.perf_counter()
+            try:
+                status = (await client.request(method, url)).status_code
+            except httpx.HTTPError:
+                status = 599
+            finally:
+                _db_time.reset(token)
+            latency = time.perf_counter() - started
+            if recording:
+                samples.setdefault(name, []).append(
+                    (latency, sum(bucket) if in_process else None, status)
+                )
+
+    try:
+        recording = False
+        deadline = time.perf_counter() + args.warmup
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+
+        recording = True
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await client.aclose()
+        if in_process:
+            await close_pools()
+
+    result = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "config": {
+            "mode": "in-process" if in_process else args.base_url,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "route_weights": {name: weight for name, weight, _ in mix.routes},
+        },
+        "table_sizes": table_sizes,
+        **summarize(samples, elapsed),
+    }
+
+    output = Path(args.output) if args.output else RESULTS_DIR / (
+        f"load-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(json.dumps(result, indent=2))
+    print(f"results written to {output}")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = subparsers.add_parser("seed", help="bulk-load synthetic data")
+    seed_parser.add_argument("--sites", type=int, default=20)
+    seed_parser.add_argument("--vcenters", type=int, default=50)
+    seed_parser.add_argument("--vms", type=int, default=100_000)
+    seed_parser.add_argument("--jobs", type=int, default=1_000_000)
+    seed_parser.add_argument("--events", type=int, default=10_000_000)
+    seed_parser.add_argument(
+        "--reset", action="store_true", help="truncate all core tables before seeding (required if the database is already seeded)"
+    )
+
+    run_parser = subparsers.add_parser("run", help="replay the route mix and record results")
+    run_parser.add_argument("--concurrency", type=int, default=32)
+    run_parser.add_argument("--duration", type=float, default=60.0)
+    run_parser.add_argument("--warmup", type=float, default=5.0)
+    run_parser.add_argument("--max-vm-pages", type=int, default=50)
+    run_parser.add_argument("--base-url", help="target a running server instead of in-process")
+    run_parser.add_argument("--output", help=f"result file (default {RESULTS_DIR}/load-<ts>.json)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    asyncio.run(seed(arguments) if arguments.command == "seed" else run(arguments))
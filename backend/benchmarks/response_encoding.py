@@ -0,0 +1,131 @@
+"""Compare the ``jsonable_encoder`` response path against ``RowJSONResponse``.
+
+Both variants are mounted on a throwaway FastAPI app and driven in-process
+through httpx's ASGI transport, so the numbers isolate encoding cost from
+network and database time.
+
+Usage (from ``backend/``)::
+
+    pip install -r requirements.txt -r benchmarks/requirements.txt
+    python -m benchmarks.response_encoding --rows 500 --requests 2000 --concurrency 16
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, List
+from uuid import UUID, uuid4
+
+import httpx
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+
+from app.responses import RowJSONResponse
+
+
+def build_vm_rows(count: int) -> List[Dict[str, Any]]:
+    """Rows shaped like ``SELECT * FROM vcenter_vms_current`` under ``dict_row``."""
+    vcenter_id = uuid4()
+    observed_at = datetime.now(timezone.utc)
+    rows = []
+    for idx in range(count):
+        rows.append(
+            {
+                "id": uuid4(),
+                "vcenter_id": vcenter_id,
+                "host_moid": f"host-{idx % 32 + 1}",
+                "moid": f"vm-{idx + 1}",
+                "uuid": str(UUID(int=idx)),
+                "payload_json": {
+                    "name": f"vm-{idx + 1:05d}.example.local",
+                    "moid": f"vm-{idx + 1}",
+                    "host_moid": f"host-{idx % 32 + 1}",
+                    "power_state": "poweredOn",
+                    "vcpu": 4,
+                    "memory_mb": 8192,
+                    "tags": ["prod", "tier-1"],
+                    "observed_at": observed_at.isoformat(),
+                },
+                "payload_hash": f"{idx:064x}",
+                "observed_at": observed_at - timedelta(seconds=idx),
+                "progress": Decimal("42.50"),
+            }
+        )
+    return rows
+
+
+def build_app(rows: List[Dict[str, Any]]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/legacy")
+    async def legacy() -> Dict[str, Any]:
+        return {"data": jsonable_encoder(rows)}
+
+    @app.get("/fast")
+    async def fast() -> RowJSONResponse:
+        return RowJSONResponse({"data": rows})
+
+    return app
+
+
+async def run_route(
+    client: httpx.AsyncClient, path: str, total: int, concurrency: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    remaining = total
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "req_per_s": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    rows = build_vm_rows(args.rows)
+    app = build_app(rows)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        legacy_body = (await client.get("/legacy")).json()
+        fast_body = (await client.get("/fast")).json()
+        if legacy_body != fast_body:
+            raise SystemExit("response bodies differ between legacy and fast paths")
+
+        results: Dict[str, Any] = {"rows": args.rows, "concurrency": args.concurrency}
+        for name, path in (("legacy", "/legacy"), ("fast", "/fast")):
+            await run_route(client, path, args.warmup, args.concurrency)
+            results[name] = await run_route(client, path, args.requests, args.concurrency)
+
+    results["speedup"] = results["fast"]["req_per_s"] / results["legacy"]["req_per_s"]
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=16)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    print(json.dumps(asyncio.run(main(parse_args())), indent=2))
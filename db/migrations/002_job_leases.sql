@@ -0,0 +1,9 @@
+-- Job lease ownership for heartbeat-based reclamation.
+-- Running jobs record the lease token of the worker process that leased them
+-- (also published in its heartbeat payload) so a reaper can re-queue (or fail,
+-- once attempts are exhausted) jobs whose process stopped heartbeating.
+
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS leased_by TEXT;
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS attempts INT NOT NULL DEFAULT 0;
+
+CREATE INDEX IF NOT EXISTS idx_jobs_running_leased_by ON jobs(leased_by) WHERE status = 'running';
@@ -0,0 +1,11 @@
+-- Recurring vCenter inventory sync schedule.
+-- The scheduler enqueues a sync once next_sync_at has passed and then pushes
+-- next_sync_at one jittered interval ahead. An interval of 0 disables
+-- scheduled syncs for that vCenter.
+
+ALTER TABLE vcenters ADD COLUMN IF NOT EXISTS sync_interval_seconds INT NOT NULL DEFAULT 900
+  CHECK (sync_interval_seconds >= 0);
+ALTER TABLE vcenters ADD COLUMN IF NOT EXISTS next_sync_at TIMESTAMPTZ;
+
+CREATE INDEX IF NOT EXISTS idx_vcenters_next_sync_at ON vcenters(next_sync_at)
+  WHERE sync_interval_seconds > 0;
@@ -8,6 +8,15 @@ class Settings:
         database_url: Optional[str] = None,
         worker_id: Optional[str] = None,
         heartbeat_interval_seconds: int = 10,
+        max_concurrent_jobs: int = 4,
+        max_jobs_per_target: int = 1,
+        max_jobs_per_site: int = 4,
+        lease_timeout_seconds: int = 60,
+        max_job_attempts: int = 3,
+        throughput_window_seconds: int = 300,
+        scheduler_interval_seconds: int = 30,
+        scheduler_batch_size: int = 100,
+        sync_jitter_fraction: float = 0.1,
     ) -> None:
         self.database_url = database_url or os.getenv(
             "DATABASE_URL",
@@ -17,6 +26,26 @@ class Settings:
         self.heartbeat_interval_seconds = int(
             os.getenv("HEARTBEAT_INTERVAL_SECONDS", heartbeat_interval_seconds)
         )
+        self.max_concurrent_jobs = int(os.getenv("MAX_CONCURRENT_JOBS", max_concurrent_jobs))
+        # Fleet-wide caps on running jobs per external endpoint (target_type +
+        # target id, e.g. one vCenter or iDRAC) and per site. Saturated jobs stay
+        # queued and the lease moves on to the next eligible job.
+        self.max_jobs_per_target = int(os.getenv("MAX_JOBS_PER_TARGET", max_jobs_per_target))
+        self.max_jobs_per_site = int(os.getenv("MAX_JOBS_PER_SITE", max_jobs_per_site))
+        # A running job whose worker has not heartbeated within this window is
+        # treated as orphaned and re-queued (or failed once attempts run out).
+        self.lease_timeout_seconds = int(os.getenv("LEASE_TIMEOUT_SECONDS", lease_timeout_seconds))
+        self.max_job_attempts = int(os.getenv("MAX_JOB_ATTEMPTS", max_job_attempts))
+        self.throughput_window_seconds = int(
+            os.getenv("THROUGHPUT_WINDOW_SECONDS", throughput_window_seconds)
+        )
+        self.scheduler_interval_seconds = int(
+            os.getenv("SCHEDULER_INTERVAL_SECONDS", scheduler_interval_seconds)
+        )
+        self.scheduler_batch_size = int(os.getenv("SCHEDULER_BATCH_SIZE", scheduler_batch_size))
+        # Each scheduled sync lands within +/- this fraction of its interval so
+        # vCenters added together drift apart instead of syncing in lockstep.
+        self.sync_jitter_fraction = float(os.getenv("SYNC_JITTER_FRACTION", sync_jitter_fraction))
 
 
 @lru_cache(maxsize=1)
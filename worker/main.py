@@ -1,20 +1,37 @@
 import asyncio
 import hashlib
 import json
+import logging
 import random
 import signal
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, Optional
-from uuid import UUID
+from typing import Any, Deque, Dict, List, Optional
+from uuid import UUID, uuid4
 
+from psycopg import OperationalError
 from psycopg.rows import dict_row
 from psycopg_pool import AsyncConnectionPool
 
 from worker.config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 pool: Optional[AsyncConnectionPool] = None
 shutdown_event = asyncio.Event()
+slot_released = asyncio.Event()
+active_jobs: Dict[UUID, asyncio.Task] = {}
+# Monotonic finish times of recent jobs, by outcome, for heartbeat throughput.
+# Attempts abandoned after losing their lease are not counted.
+completed_at: Deque[float] = deque()
+failed_at: Deque[float] = deque()
+# Arbitrary application-wide key for pg_advisory_xact_lock around job leasing.
+LEASE_LOCK_KEY = 0x45494F4C
+# Identifies this process's leases. WORKER_ID survives restarts, so leasing by
+# it alone would let a restarted worker's fresh heartbeat keep its predecessor's
+# running jobs alive forever.
+LEASE_TOKEN = f"{settings.worker_id}:{uuid4()}"
 
 
 def _hash_payload(payload: Dict[str, Any]) -> str:
@@ -28,7 +45,8 @@ async def init_pool() -> AsyncConnectionPool:
         pool = AsyncConnectionPool(
             conninfo=settings.database_url,
             min_size=1,
-            max_size=5,
+            # One connection per concurrent job plus heartbeat/reaper and leasing.
+            max_size=settings.max_concurrent_jobs + 2,
             open=True,
             kwargs={"row_factory": dict_row},
         )
@@ -56,36 +74,252 @@ async def append_event(
     )
 
 
-async def write_heartbeat() -> None:
+class LeaseLost(Exception):
+    """Raised when a job's lease was reclaimed while this process was still working on it."""
+
+
+async def update_leased_job(conn, job_id: UUID, assignments: str, params: tuple = ()) -> None:
+    """Update a running job only while this process still holds its lease.
+
+    Raises LeaseLost when no row matches, so the caller rolls back instead of
+    overwriting an attempt that another worker re-leased.
+    """
+    cursor = await conn.execute(
+        f"""
+        UPDATE jobs
+        SET {assignments}
+        WHERE id = %s AND leased_by = %s AND status = 'running'
+        """,
+        (*params, job_id, LEASE_TOKEN),
+    )
+    if cursor.rowcount == 0:
+        raise LeaseLost(f"lease on job {job_id} is no longer held by {LEASE_TOKEN}")
+
+
+async def fail_leased_job(
+    conn,
+    job_id: UUID,
+    step_id: Optional[UUID],
+    error: str,
+    message: str,
+    data: Optional[Dict[str, Any]] = None,
+) -> None:
+    await update_leased_job(conn, job_id, "status = 'failed', completed_at = now(), updated_at = now()")
+    await conn.execute(
+        """
+        UPDATE job_steps
+        SET status = 'failed', completed_at = now(), error = %s
+        WHERE id = %s AND status = 'running'
+        """,
+        (error, step_id),
+    )
+    await append_event(conn, job_id, step_id, "error", message, data)
+
+
+def build_heartbeat_payload() -> Dict[str, Any]:
+    window = settings.throughput_window_seconds
+    cutoff = time.monotonic() - window
+    for finished in (completed_at, failed_at):
+        while finished and finished[0] < cutoff:
+            finished.popleft()
+    in_use = len(active_jobs)
+    return {
+        "status": "busy" if in_use else "idle",
+        "lease_token": LEASE_TOKEN,
+        "active_job_ids": [str(job_id) for job_id in active_jobs],
+        "concurrency": {"in_use": in_use, "limit": settings.max_concurrent_jobs},
+        "throughput": {
+            "window_seconds": window,
+            "completed": len(completed_at),
+            "failed": len(failed_at),
+            "jobs_per_minute": round(len(completed_at) * 60 / window, 2),
+        },
+    }
+
+
+class WorkerIdConflict(RuntimeError):
+    """Raised when another live process is heartbeating under this WORKER_ID."""
+
+
+async def write_heartbeat(takeover: bool = False) -> bool:
+    """Upsert this process's heartbeat; return False if another live process owns the row.
+
+    The row is keyed by WORKER_ID, so only overwrite it when it already carries
+    our lease token, has gone stale, or we have established that its owner died.
+    """
     conn_pool = await init_pool()
     async with conn_pool.connection() as conn:
-        await conn.execute(
+        cursor = await conn.execute(
             """
             INSERT INTO worker_heartbeats (worker_id, last_seen, payload, updated_at)
-            VALUES (%s, now(), jsonb_build_object('status', 'idle'), now())
+            VALUES (%(worker_id)s, now(), %(payload)s, now())
             ON CONFLICT (worker_id)
             DO UPDATE SET last_seen = EXCLUDED.last_seen,
                           payload = EXCLUDED.payload,
                           updated_at = EXCLUDED.updated_at
+            WHERE %(takeover)s
+               OR worker_heartbeats.payload->>'lease_token' = %(token)s
+               OR worker_heartbeats.last_seen < now() - make_interval(secs => %(timeout)s)
+            RETURNING worker_id
             """,
+            {
+                "worker_id": settings.worker_id,
+                "payload": json.dumps(build_heartbeat_payload()),
+                "takeover": takeover,
+                "token": LEASE_TOKEN,
+                "timeout": settings.lease_timeout_seconds,
+            },
+        )
+        written = await cursor.fetchone() is not None
+        await conn.commit()
+        return written
+
+
+async def read_heartbeat_last_seen() -> Optional[datetime]:
+    conn_pool = await init_pool()
+    async with conn_pool.connection() as conn:
+        cursor = await conn.execute(
+            "SELECT last_seen FROM worker_heartbeats WHERE worker_id = %s",
             (settings.worker_id,),
         )
+        row = await cursor.fetchone()
+        return row["last_seen"] if row else None
+
+
+async def register_worker() -> None:
+    """Publish our lease token, refusing to share WORKER_ID with a live process.
+
+    A fresh heartbeat under our id with another token is either a predecessor
+    that just crashed (its last_seen stops advancing) or a second process with
+    the same WORKER_ID (it keeps heartbeating). Watching it for one and a half
+    heartbeat intervals tells them apart; a dead predecessor's row is taken over
+    so its running jobs are reclaimed immediately.
+    """
+    if await write_heartbeat():
+        return
+    seen = await read_heartbeat_last_seen()
+    logger.warning(
+        "Fresh heartbeat for %s carries another lease token; checking whether its owner is alive",
+        settings.worker_id,
+    )
+    await asyncio.sleep(settings.heartbeat_interval_seconds * 1.5)
+    if await read_heartbeat_last_seen() != seen:
+        raise WorkerIdConflict(
+            f"another live worker is heartbeating as {settings.worker_id!r}; set a unique WORKER_ID"
+        )
+    await write_heartbeat(takeover=True)
+
+
+async def reap_orphaned_jobs() -> List[UUID]:
+    """Re-queue or fail running jobs whose leasing process stopped heartbeating.
+
+    Leases are matched to heartbeats by lease token, so a worker that crashed and
+    restarted under the same WORKER_ID has its predecessor's jobs reclaimed on the
+    first tick instead of after the lease timeout.
+
+    Runs as a single statement so concurrent reapers on other workers skip rows
+    already being reclaimed instead of double-handling them.
+    """
+    conn_pool = await init_pool()
+    async with conn_pool.connection() as conn:
+        cursor = await conn.execute(
+            """
+            WITH orphaned AS (
+                SELECT j.id, j.leased_by
+                FROM jobs j
+                LEFT JOIN worker_heartbeats h ON h.payload->>'lease_token' = j.leased_by
+                WHERE j.status = 'running'
+                  AND (h.worker_id IS NULL OR h.last_seen < now() - make_interval(secs => %(timeout)s))
+                FOR UPDATE OF j SKIP LOCKED
+            ),
+            reaped AS (
+                UPDATE jobs
+                SET status = CASE WHEN jobs.attempts < %(max_attempts)s THEN 'pending' ELSE 'failed' END,
+                    completed_at = CASE WHEN jobs.attempts < %(max_attempts)s THEN NULL ELSE now() END,
+                    leased_by = NULL,
+                    updated_at = now()
+                FROM orphaned
+                WHERE jobs.id = orphaned.id
+                RETURNING jobs.id, jobs.status, jobs.attempts, orphaned.leased_by
+            ),
+            failed_steps AS (
+                UPDATE job_steps
+                SET status = 'failed', completed_at = now(), error = 'Worker heartbeat lost'
+                FROM reaped
+                WHERE job_steps.job_id = reaped.id AND job_steps.status = 'running'
+            )
+            INSERT INTO job_events (job_id, step_id, timestamp, level, message, data, created_at)
+            SELECT
+                reaped.id,
+                NULL,
+                now(),
+                CASE WHEN reaped.status = 'failed' THEN 'error' ELSE 'warning' END,
+                CASE WHEN reaped.status = 'failed'
+                     THEN 'Job failed after worker heartbeat lost'
+                     ELSE 'Job re-queued after worker heartbeat lost' END,
+                jsonb_build_object(
+                    'leased_by', reaped.leased_by,
+                    'reaped_by', %(worker_id)s::text,
+                    'attempts', reaped.attempts
+                ),
+                now()
+            FROM reaped
+            RETURNING job_id
+            """,
+            {
+                "timeout": settings.lease_timeout_seconds,
+                "max_attempts": settings.max_job_attempts,
+                "worker_id": settings.worker_id,
+            },
+        )
+        rows = await cursor.fetchall()
         await conn.commit()
+        return [row["job_id"] for row in rows]
 
 
 async def lease_pending_job() -> Optional[dict]:
     conn_pool = await init_pool()
     async with conn_pool.connection() as conn:
         async with conn.transaction():
+            # Serialize leasing across workers so two of them cannot both see
+            # a target one below its limit and push it over.
+            await conn.execute("SELECT pg_advisory_xact_lock(%s)", (LEASE_LOCK_KEY,))
             cursor = await conn.execute(
                 """
-                SELECT id, type, target_ids
-                FROM jobs
-                WHERE status IN ('pending', 'scheduled')
-                ORDER BY created_at ASC
-                FOR UPDATE SKIP LOCKED
+                WITH target_load AS (
+                    SELECT target_type, target_id, COUNT(*) AS active
+                    FROM jobs, unnest(target_ids) AS target_id
+                    WHERE status = 'running'
+                    GROUP BY target_type, target_id
+                ),
+                site_load AS (
+                    SELECT site_id, COUNT(*) AS active
+                    FROM jobs
+                    WHERE status = 'running' AND site_id IS NOT NULL
+                    GROUP BY site_id
+                )
+                SELECT j.id, j.type, j.target_ids
+                FROM jobs j
+                WHERE j.status IN ('pending', 'scheduled')
+                  AND NOT EXISTS (
+                      SELECT 1 FROM target_load t
+                      WHERE t.target_type = j.target_type
+                        AND t.target_id = ANY(j.target_ids)
+                        AND t.active >= %(max_per_target)s
+                  )
+                  AND NOT EXISTS (
+                      SELECT 1 FROM site_load s
+                      WHERE s.site_id = j.site_id
+                        AND s.active >= %(max_per_site)s
+                  )
+                ORDER BY j.created_at ASC
+                FOR UPDATE OF j SKIP LOCKED
                 LIMIT 1
-                """
+                """,
+                {
+                    "max_per_target": settings.max_jobs_per_target,
+                    "max_per_site": settings.max_jobs_per_site,
+                },
             )
             row = await cursor.fetchone()
             if row is None:
@@ -97,21 +331,25 @@ async def lease_pending_job() -> Optional[dict]:
             await conn.execute(
                 """
                 UPDATE jobs
-                SET status = 'running', started_at = COALESCE(started_at, now()), updated_at = now()
+                SET status = 'running', started_at = COALESCE(started_at, now()), updated_at = now(),
+                    leased_by = %s, attempts = attempts + 1
                 WHERE id = %s
                 """,
-                (job_id,),
+                (LEASE_TOKEN, job_id),
             )
 
+            # Re-queued jobs already have steps from earlier attempts.
             step_cursor = await conn.execute(
                 """
                 INSERT INTO job_steps (
                     job_id, sequence, name, status, started_at, created_at
                 )
-                VALUES (%s, 1, 'Lease and queue job', 'running', now(), now())
+                SELECT %s, COALESCE(MAX(sequence), 0) + 1, 'Lease and queue job', 'running', now(), now()
+                FROM job_steps
+                WHERE job_id = %s
                 RETURNING id
                 """,
-                (job_id,),
+                (job_id, job_id),
             )
             step_row = await step_cursor.fetchone()
             step_id: Optional[UUID] = step_row["id"] if step_row else None
@@ -186,25 +424,26 @@ async def upsert_vms(conn, vcenter_id: UUID, records: Dict[str, Dict[str, Any]])
         )
 
 
-async def process_vcenter_inventory_job(job: dict) -> None:
+async def process_vcenter_inventory_job(job: dict) -> Optional[str]:
+    """Run an inventory sync; return its recorded outcome, or None if the lease was lost."""
     job_id = job["job_id"]
     step_id = job["step_id"]
     targets = job.get("target_ids") or []
     if not targets:
         # No target; mark failed
-        await mark_job_failed(job_id, step_id, "Missing vcenter target id")
-        return
+        return await mark_job_failed(job_id, step_id, "Missing vcenter target id")
 
     vcenter_id = UUID(targets[0])
     conn_pool = await init_pool()
     async with conn_pool.connection() as conn:
         try:
             await append_event(conn, job_id, step_id, "info", "Starting vCenter inventory sync", {"vcenter_id": str(vcenter_id)})
-            random.seed(vcenter_id.int & 0xFFFFFFFF)
+            # Per-job generator: concurrent jobs must not share the global random state.
+            rng = random.Random(vcenter_id.int & 0xFFFFFFFF)
 
-            cluster_count = 2 + random.randint(0, 2)
-            host_count = 3 + random.randint(0, 3)
-            vm_count = 5 + random.randint(0, 10)
+            cluster_count = 2 + rng.randint(0, 2)
+            host_count = 3 + rng.randint(0, 3)
+            vm_count = 5 + rng.randint(0, 10)
 
             clusters: Dict[str, Dict[str, Any]] = {}
             for idx in range(cluster_count):
@@ -212,23 +451,23 @@ async def process_vcenter_inventory_job(job: dict) -> None:
                 payload = {
                     "name": f"Cluster-{idx+1}",
                     "moid": moid,
-                    "cpu_usage_percent": random.randint(20, 80),
-                    "memory_usage_percent": random.randint(20, 80),
+                    "cpu_usage_percent": rng.randint(20, 80),
+                    "memory_usage_percent": rng.randint(20, 80),
                     "drs_enabled": True,
-                    "ha_enabled": bool(random.randint(0, 1)),
+                    "ha_enabled": bool(rng.randint(0, 1)),
                     "observed_at": datetime.utcnow().isoformat() + "Z",
                 }
                 clusters[moid] = payload
 
             await upsert_clusters(conn, vcenter_id, clusters)
             await append_event(conn, job_id, step_id, "info", "Clusters synced", {"count": len(clusters)})
-            await conn.execute("UPDATE jobs SET progress = 25 WHERE id = %s", (job_id,))
+            await update_leased_job(conn, job_id, "progress = 25")
             await conn.commit()
             await asyncio.sleep(1)
 
             hosts: Dict[str, Dict[str, Any]] = {}
             for idx in range(host_count):
-                cluster_moid = random.choice(list(clusters.keys()))
+                cluster_moid = rng.choice(list(clusters.keys()))
                 moid = f"host-{idx+1}"
                 payload = {
                     "name": f"esxi-{idx+1}.example.local",
@@ -243,113 +482,126 @@ async def process_vcenter_inventory_job(job: dict) -> None:
 
             await upsert_hosts(conn, vcenter_id, hosts)
             await append_event(conn, job_id, step_id, "info", "Hosts synced", {"count": len(hosts)})
-            await conn.execute("UPDATE jobs SET progress = 60 WHERE id = %s", (job_id,))
+            await update_leased_job(conn, job_id, "progress = 60")
             await conn.commit()
             await asyncio.sleep(1)
 
             vms: Dict[str, Dict[str, Any]] = {}
             for idx in range(vm_count):
-                host_moid = random.choice(list(hosts.keys()))
+                host_moid = rng.choice(list(hosts.keys()))
                 moid = f"vm-{idx+1}"
                 payload = {
                     "name": f"vm-{idx+1:03d}.example.local",
                     "moid": moid,
                     "host_moid": host_moid,
                     "uuid": str(UUID(int=(vcenter_id.int + idx) & ((1 << 128) - 1))),
-                    "power_state": random.choice(["poweredOn", "poweredOff", "suspended"]),
-                    "vcpu": random.randint(1, 16),
-                    "memory_mb": random.choice([2048, 4096, 8192, 16384]),
+                    "power_state": rng.choice(["poweredOn", "poweredOff", "suspended"]),
+                    "vcpu": rng.randint(1, 16),
+                    "memory_mb": rng.choice([2048, 4096, 8192, 16384]),
                     "observed_at": datetime.utcnow().isoformat() + "Z",
                 }
                 vms[moid] = payload
 
             await upsert_vms(conn, vcenter_id, vms)
             await append_event(conn, job_id, step_id, "info", "VMs synced", {"count": len(vms)})
-            await conn.execute("UPDATE jobs SET progress = 90 WHERE id = %s", (job_id,))
+            await update_leased_job(conn, job_id, "progress = 90")
             await conn.commit()
             await asyncio.sleep(1)
 
+            await update_leased_job(
+                conn,
+                job_id,
+                "status = 'completed', completed_at = now(), progress = 100, updated_at = now()",
+            )
+            # Never flip a step the reaper already marked failed back to completed.
             await conn.execute(
                 """
                 UPDATE job_steps
                 SET status = 'completed', completed_at = now()
-                WHERE id = %s
+                WHERE id = %s AND status = 'running'
                 """,
                 (step_id,),
             )
             await conn.execute(
-                """
-                UPDATE jobs
-                SET status = 'completed', completed_at = now(), progress = 100, updated_at = now()
-                WHERE id = %s
-                """,
-                (job_id,),
+                "UPDATE vcenters SET last_sync = now(), updated_at = now() WHERE id = %s",
+                (vcenter_id,),
             )
             await append_event(conn, job_id, step_id, "info", "vCenter inventory sync completed", {"vcenter_id": str(vcenter_id)})
             await conn.commit()
+            return "completed"
+        except LeaseLost:
+            await conn.rollback()
+            logger.warning("Lease on job %s was reclaimed; abandoning this attempt", job_id)
+            return None
         except Exception as exc:  # noqa: B902
-            await conn.execute(
-                """
-                UPDATE job_steps
-                SET status = 'failed', completed_at = now(), error = %s
-                WHERE id = %s
-                """,
-                (str(exc), step_id),
-            )
-            await conn.execute(
-                """
-                UPDATE jobs
-                SET status = 'failed', completed_at = now(), updated_at = now()
-                WHERE id = %s
-                """,
-                (job_id,),
-            )
-            await append_event(
-                conn,
-                job_id,
-                step_id,
-                "error",
-                "vCenter inventory sync failed",
-                {"error": str(exc)},
-            )
-            await conn.commit()
+            await conn.rollback()
+            try:
+                await fail_leased_job(
+                    conn,
+                    job_id,
+                    step_id,
+                    str(exc),
+                    "vCenter inventory sync failed",
+                    {"error": str(exc)},
+                )
+                await conn.commit()
+                return "failed"
+            except LeaseLost:
+                await conn.rollback()
+                logger.warning("Lease on job %s was reclaimed; not recording failure", job_id)
+                return None
 
 
-async def mark_job_failed(job_id: UUID, step_id: Optional[UUID], message: str) -> None:
+async def mark_job_failed(job_id: UUID, step_id: Optional[UUID], message: str) -> Optional[str]:
     conn_pool = await init_pool()
     async with conn_pool.connection() as conn:
-        await conn.execute(
-            """
-            UPDATE job_steps
-            SET status = 'failed', completed_at = now(), error = %s
-            WHERE id = %s
-            """,
-            (message, step_id),
-        )
-        await conn.execute(
-            """
-            UPDATE jobs
-            SET status = 'failed', completed_at = now(), updated_at = now()
-            WHERE id = %s
-            """,
-            (job_id,),
-        )
-        await append_event(conn, job_id, step_id, "error", message)
-        await conn.commit()
+        try:
+            await fail_leased_job(conn, job_id, step_id, message, message)
+            await conn.commit()
+            return "failed"
+        except LeaseLost:
+            await conn.rollback()
+            logger.warning("Lease on job %s was reclaimed; not recording failure", job_id)
+            return None
+
+
+async def run_job(lease_info: dict) -> None:
+    outcome: Optional[str] = None
+    try:
+        if lease_info["type"] == "vcenter_inventory_sync":
+            outcome = await process_vcenter_inventory_job(lease_info)
+        else:
+            outcome = await mark_job_failed(
+                lease_info["job_id"], lease_info["step_id"], f"Unsupported job type {lease_info['type']}"
+            )
+    finally:
+        active_jobs.pop(lease_info["job_id"], None)
+        if outcome == "completed":
+            completed_at.append(time.monotonic())
+        elif outcome == "failed":
+            failed_at.append(time.monotonic())
+        slot_released.set()
 
 
-async def worker_loop() -> None:
-    await init_pool()
+async def heartbeat_loop() -> None:
+    last_heartbeat = time.monotonic()
     while not shutdown_event.is_set():
-        await write_heartbeat()
-        lease_info = await lease_pending_job()
-        if lease_info:
-            if lease_info["type"] == "vcenter_inventory_sync":
-                await process_vcenter_inventory_job(lease_info)
-            else:
-                await mark_job_failed(
-                    lease_info["job_id"], lease_info["step_id"], f"Unsupported job type {lease_info['type']}"
+        try:
+            if not await write_heartbeat():
+                raise WorkerIdConflict(
+                    f"another worker took over WORKER_ID {settings.worker_id!r}; our leases are void"
                 )
+            last_heartbeat = time.monotonic()
+        except OperationalError:
+            # Transient DB errors must not take in-flight jobs down with them.
+            # Once our leases have expired they are being reclaimed anyway.
+            if time.monotonic() - last_heartbeat > settings.lease_timeout_seconds:
+                raise
+            logger.warning("Heartbeat write failed; retrying next tick", exc_info=True)
+        try:
+            await reap_orphaned_jobs()
+        except OperationalError:
+            logger.warning("Orphaned job reaper failed; retrying next tick", exc_info=True)
         try:
             await asyncio.wait_for(
                 shutdown_event.wait(),
@@ -359,6 +611,50 @@ async def worker_loop() -> None:
             continue
 
 
+async def wait_for_capacity_or_shutdown() -> None:
+    waiters = [
+        asyncio.ensure_future(shutdown_event.wait()),
+        asyncio.ensure_future(slot_released.wait()),
+    ]
+    await asyncio.wait(
+        waiters,
+        timeout=settings.heartbeat_interval_seconds,
+        return_when=asyncio.FIRST_COMPLETED,
+    )
+    for waiter in waiters:
+        waiter.cancel()
+
+
+async def worker_loop() -> None:
+    await init_pool()
+    # Publish our lease token before leasing anything; otherwise another
+    # worker's reaper can reclaim a job leased before our first heartbeat.
+    await register_worker()
+    heartbeat_task = asyncio.create_task(heartbeat_loop())
+    while not shutdown_event.is_set():
+        if heartbeat_task.done():
+            # Without heartbeats the reaper would hand our jobs to other workers.
+            heartbeat_task.result()
+            raise RuntimeError("heartbeat loop exited unexpectedly")
+        slot_released.clear()
+        while len(active_jobs) < settings.max_concurrent_jobs:
+            try:
+                lease_info = await lease_pending_job()
+            except OperationalError:
+                # Like heartbeats, a transient DB error must not cancel in-flight jobs.
+                logger.warning("Leasing failed; retrying after the next wait", exc_info=True)
+                break
+            if lease_info is None:
+                break
+            active_jobs[lease_info["job_id"]] = asyncio.create_task(run_job(lease_info))
+        await wait_for_capacity_or_shutdown()
+
+    if active_jobs:
+        await asyncio.gather(*active_jobs.values(), return_exceptions=True)
+    await heartbeat_task
+    await write_heartbeat()
+
+
 def request_shutdown() -> None:
     shutdown_event.set()
 
@@ -377,4 +673,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
     asyncio.run(main())
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+from typing import List, Optional
+from uuid import UUID
+
+from psycopg import AsyncConnection, OperationalError
+
+from worker import main as worker
+from worker.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+# Arbitrary application-wide key for the session-level leader lock.
+SCHEDULER_LOCK_KEY = 0x45494F53
+
+
+async def acquire_leadership() -> Optional[AsyncConnection]:
+    """Return a dedicated connection holding the scheduler lock, or None if another instance leads.
+
+    The lock is session-scoped, so leadership lasts exactly as long as this
+    connection: if the leader dies or loses its connection, Postgres releases
+    the lock and a standby takes over on its next attempt.
+    """
+    conn = await AsyncConnection.connect(settings.database_url, autocommit=True)
+    cursor = await conn.execute("SELECT pg_try_advisory_lock(%s)", (SCHEDULER_LOCK_KEY,))
+    row = await cursor.fetchone()
+    if row and row[0]:
+        return conn
+    await conn.close()
+    return None
+
+
+async def enqueue_due_syncs(conn: AsyncConnection) -> List[UUID]:
+    """Enqueue one batch of due syncs on the lock-holding connection.
+
+    Running on the leader session itself fences the work: if that session has
+    died, the lock is gone and so is the transaction, so nothing is enqueued.
+    """
+    async with conn.transaction():
+        # Newly registered vCenters, and slots missed during a scheduler outage
+        # or leader handover, are spread uniformly over the next interval
+        # rather than all firing in this tick. Normal operation is at most one
+        # tick late, well inside the backlog threshold.
+        await conn.execute(
+            """
+            UPDATE vcenters
+            SET next_sync_at = now() + make_interval(secs => sync_interval_seconds * random())
+            WHERE sync_interval_seconds > 0
+              AND (
+                  next_sync_at IS NULL
+                  OR next_sync_at < now() - make_interval(secs => %s)
+              )
+            """,
+            (2 * settings.scheduler_interval_seconds,),
+        )
+        cursor = await conn.execute(
+            """
+            WITH due AS (
+                SELECT v.id, v.site_id, v.name, v.sync_interval_seconds, v.next_sync_at
+                FROM vcenters v
+                WHERE v.sync_interval_seconds > 0
+                  AND v.next_sync_at <= now()
+                  AND NOT EXISTS (
+                      SELECT 1 FROM jobs j
+                      WHERE j.type = 'vcenter_inventory_sync'
+                        AND j.status IN ('pending', 'scheduled', 'running')
+                        AND j.target_ids = ARRAY[v.id::text]
+                  )
+                ORDER BY v.next_sync_at ASC
+                LIMIT %(batch_size)s
+                FOR UPDATE OF v SKIP LOCKED
+            ),
+            rescheduled AS (
+                UPDATE vcenters
+                -- Advance from the slot itself, not from now(), so vCenters keep
+                -- their spread instead of converging on the tick that fired them.
+                SET next_sync_at = GREATEST(
+                        due.next_sync_at + make_interval(
+                            secs => due.sync_interval_seconds * (1 + (random() * 2 - 1) * %(jitter)s)
+                        ),
+                        now()
+                    )
+                FROM due
+                WHERE vcenters.id = due.id
+            )
+            INSERT INTO jobs (
+                type, name, description, status, priority, site_id, target_type,
+                target_ids, policy, scheduled_at, progress, current_step, total_steps,
+                external_task_ids
+            )
+            SELECT
+                'vcenter_inventory_sync',
+                'Inventory sync: ' || due.name,
+                'Scheduled recurring sync',
+                'pending',
+                0,
+                due.site_id,
+                'vcenter',
+                ARRAY[due.id::text],
+                '{}'::jsonb,
+                now(),
+                0,
+                0,
+                0,
+                ARRAY[]::text[]
+            FROM due
+            RETURNING id
+            """,
+            {
+                "batch_size": settings.scheduler_batch_size,
+                "jitter": settings.sync_jitter_fraction,
+            },
+        )
+        rows = await cursor.fetchall()
+    return [row[0] for row in rows]
+
+
+async def wait_or_shutdown(timeout: float) -> None:
+    try:
+        await asyncio.wait_for(worker.shutdown_event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+async def scheduler_loop() -> None:
+    leader_conn: Optional[AsyncConnection] = None
+    try:
+        while not worker.shutdown_event.is_set():
+            try:
+                if leader_conn is None or leader_conn.closed:
+                    leader_conn = await acquire_leadership()
+                    if leader_conn is not None:
+                        logger.info("Acquired scheduler leadership")
+                if leader_conn is not None:
+                    # Keep draining while full batches come back so a backlog
+                    # clears without waiting a whole tick per batch.
+                    while not worker.shutdown_event.is_set():
+                        enqueued = await enqueue_due_syncs(leader_conn)
+                        if enqueued:
+                            logger.info("Enqueued %d scheduled vCenter syncs", len(enqueued))
+                        if len(enqueued) < settings.scheduler_batch_size:
+                            break
+            except OperationalError:
+                # Lost the database (and with it the lock); re-elect next tick.
+                logger.warning("Scheduler database error; re-electing next tick", exc_info=True)
+                if leader_conn is not None:
+                    logger.warning("Released scheduler leadership")
+                    await leader_conn.close()
+                leader_conn = None
+            await wait_or_shutdown(settings.scheduler_interval_seconds)
+    finally:
+        if leader_conn is not None:
+            await leader_conn.close()
+
+
+async def main() -> None:
+    worker.register_signal_handlers()
+    await scheduler_loop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    asyncio.run(main())